@@ -28,7 +28,7 @@ app.include_router(chat.router)
 
 
 @app.get("/api/health")
-async def health():
+async def health() -> dict:
     return {
         "status": "ok",
         "service": "compass-backend",
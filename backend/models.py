@@ -1,7 +1,8 @@
 """Core data models for the financial planning engine."""
 
 from __future__ import annotations
-from pydantic import BaseModel, Field
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 from typing import Optional, List
 from enum import Enum
 
@@ -71,6 +72,9 @@ class FinancialGoal(BaseModel):
 class FinancialProfile(BaseModel):
     """Everything we need to build a comprehensive financial plan."""
 
+    # Request profiles are never mutated, so computed helpers can be cached
+    model_config = ConfigDict(frozen=True)
+
     # Personal
     name: str = Field("", examples=["Alex"])
     age: int = Field(..., ge=18, le=100)
@@ -99,30 +103,36 @@ class FinancialProfile(BaseModel):
     # Risk
     risk_tolerance: RiskTolerance = RiskTolerance.moderate
 
-    # Computed helpers
-    @property
+    # Computed helpers (evaluated at most once per instance)
+    @computed_field
+    @cached_property
     def total_debt(self) -> float:
         return sum(d.balance for d in self.debts)
 
-    @property
+    @computed_field
+    @cached_property
     def total_investments(self) -> float:
         return sum(a.balance for a in self.accounts)
 
-    @property
+    @computed_field
+    @cached_property
     def net_worth(self) -> float:
         return self.total_investments + self.emergency_fund - self.total_debt
 
-    @property
+    @computed_field
+    @cached_property
     def monthly_income(self) -> float:
         return (self.annual_income + self.other_income) / 12
 
-    @property
+    @computed_field
+    @cached_property
     def monthly_savings_rate(self) -> float:
         if self.monthly_income <= 0:
             return 0
         return max(0, (self.monthly_income - self.monthly_expenses) / self.monthly_income * 100)
 
-    @property
+    @computed_field
+    @cached_property
     def monthly_debt_payments(self) -> float:
         return sum(d.minimum_payment for d in self.debts)
 
@@ -167,3 +177,80 @@ class DecisionItem(BaseModel):
     requires_human: bool = True
     category: str = "financial"
     human_decision: Optional[str] = None
+
+
+# ── AI response schemas ────────────────────────────────
+# Structured-output schemas for the planner's LLM calls. Fields are plain and
+# required so they translate to strict JSON schemas; they mirror frontend types.
+class Recommendation(BaseModel):
+    id: str
+    title: str
+    description: str
+    impact: str
+    category: str
+    action: str
+    monthly_impact: float
+
+
+class TaxInsight(BaseModel):
+    title: str
+    description: str
+    estimated_savings: float
+
+
+class AnalysisResult(BaseModel):
+    health_score: int
+    health_grade: str
+    health_summary: str
+    strengths: List[str]
+    warnings: List[str]
+    recommendations: List[Recommendation]
+    tax_insights: List[TaxInsight]
+    emergency_fund_months: float
+    emergency_fund_target: float
+    ideal_savings_rate: float
+    debt_freedom_priority: str
+    retirement_readiness: str
+    key_risk: str
+
+
+class DecisionOption(BaseModel):
+    label: str
+    description: str
+
+
+class DecisionProposal(BaseModel):
+    id: str
+    title: str
+    description: str
+    ai_recommendation: str
+    ai_reasoning: str
+    impact_score: float
+    requires_human: bool
+    category: str
+    options: List[DecisionOption]
+
+
+class CriticalDecision(BaseModel):
+    title: str
+    reason: str
+
+
+class DecisionsResult(BaseModel):
+    decisions: List[DecisionProposal]
+    critical_human_decision: CriticalDecision
+
+
+class ScenarioTradeOff(BaseModel):
+    scenario: str
+    pros: List[str]
+    cons: List[str]
+    projected_outcome: str
+
+
+class ScenarioComparison(BaseModel):
+    comparison_summary: str
+    recommended_scenario: str
+    reasoning: str
+    trade_offs: List[ScenarioTradeOff]
+    human_note: str
@@ -10,10 +10,21 @@ router = APIRouter(prefix="/api/chat", tags=["chat"])
 
 @router.post("")
 async def chat(req: ChatRequest):
-    """Send a message in the financial planning chat. Full profile context is included."""
+    """Send a message in the financial planning chat. Full profile context is included.
+
+    The reply is streamed back as plain text chunks as the model generates it.
+    """
+    stream = chat_with_context(req.profile, req.messages)
+
+    # Pull the first chunk before responding so upstream failures still map to a 500
     try:
-        messages = [{"role": m.role, "content": m.content} for m in req.messages]
-        response = await chat_with_context(req.profile, messages)
-        return {"reply": response}
+        first = await anext(stream, "")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
+
+    async def reply():
+        yield first
+        async for delta in stream:
+            yield delta
+
+    return StreamingResponse(reply(), media_type="text/plain; charset=utf-8")
@@ -1,25 +1,28 @@
 """Planning API routes — analysis, scenarios, decisions."""
 
+import asyncio
 from fastapi import APIRouter, HTTPException
-from models import AnalysisRequest, ScenarioRequest, FinancialProfile, ScenarioParam
-from services.ai_planner import analyze_profile, generate_decisions, compare_scenarios
+from models import AnalysisRequest, ScenarioRequest, ScenarioParam
+from services.ai_planner import analyze_profile, generate_decisions, compare_scenarios, profile_cache_key
 from services.simulator import project_profile, run_projection, RETURN_PROFILES
 
 router = APIRouter(prefix="/api/planning", tags=["planning"])
 
 
 @router.post("/analyze")
-async def analyze(req: AnalysisRequest):
+async def analyze(req: AnalysisRequest) -> dict:
     """Run full AI analysis on a financial profile. Returns health score, recommendations, etc."""
     try:
-        # Run Monte Carlo simulations
-        projections = project_profile(req.profile)
-
-        # Run AI analysis
-        analysis = await analyze_profile(req.profile)
+        # Run Monte Carlo simulations (worker thread) alongside the AI analysis;
+        # both AI calls share one cached profile summary
+        profile_key = profile_cache_key(req.profile)
+        projections, analysis = await asyncio.gather(
+            asyncio.to_thread(project_profile, req.profile),
+            analyze_profile(req.profile, profile_key),
+        )
 
         # Generate decision items
-        decisions = await generate_decisions(req.profile, analysis)
+        decisions = await generate_decisions(req.profile, analysis, profile_key)
 
         return {
             "analysis": analysis,
@@ -39,50 +42,57 @@ async def analyze(req: AnalysisRequest):
 
 
 @router.post("/scenarios")
-async def run_scenarios(req: ScenarioRequest):
+async def run_scenarios(req: ScenarioRequest) -> dict:
     """Compare multiple what-if scenarios with Monte Carlo projections + AI analysis."""
     try:
         profile = req.profile
         scenario_results = {}
+        projection_tasks = []
 
-        for scenario in req.scenarios:
-            # Create modified profile for this scenario
-            modified = profile.model_copy(deep=True)
+        # Profile-level totals are the same for every scenario
+        base_monthly_contrib = sum(a.monthly_contribution for a in profile.accounts)
+        goal_total = sum(g.target_amount for g in profile.goals) if profile.goals else 1_000_000
 
+        for scenario in req.scenarios:
             if scenario.retirement_age is not None:
                 years = max(1, scenario.retirement_age - profile.age)
             else:
                 years = max(1, 65 - profile.age)
 
             # Adjust parameters
-            monthly_contrib = sum(a.monthly_contribution for a in modified.accounts)
+            monthly_contrib = base_monthly_contrib
             if scenario.monthly_savings is not None:
                 monthly_contrib = scenario.monthly_savings
 
             if scenario.income_change is not None:
-                adjusted_income = modified.annual_income * (1 + scenario.income_change / 100)
-                monthly_contrib += (adjusted_income - modified.annual_income) / 12 * 0.5
+                adjusted_income = profile.annual_income * (1 + scenario.income_change / 100)
+                monthly_contrib += (adjusted_income - profile.annual_income) / 12 * 0.5
 
-            risk = scenario.risk_tolerance or modified.risk_tolerance
+            risk = scenario.risk_tolerance or profile.risk_tolerance
 
-            proj = run_projection(
-                current_balance=modified.total_investments,
+            # Monte Carlo is CPU-bound NumPy — run each scenario in a worker thread
+            projection_tasks.append(asyncio.to_thread(
+                run_projection,
+                current_balance=profile.total_investments,
                 monthly_contribution=monthly_contrib,
                 years=years,
                 risk=risk,
-                target=sum(g.target_amount for g in modified.goals) if modified.goals else 1_000_000,
+                target=goal_total,
                 n_simulations=3000,
-            )
+            ))
+
+        projs = await asyncio.gather(*projection_tasks)
 
+        for scenario, proj in zip(req.scenarios, projs):
             scenario_results[scenario.label] = {
-                "portfolio": proj.__dict__,
-                "params": scenario.model_dump(),
+                "portfolio": proj.to_dict(),
+                "params": scenario.model_dump(exclude_none=True),
             }
 
         # AI comparison
         ai_comparison = await compare_scenarios(
             profile,
-            [s.model_dump() for s in req.scenarios],
+            [s.model_dump(exclude_none=True) for s in req.scenarios],
             scenario_results,
         )
 
@@ -95,10 +105,12 @@ async def run_scenarios(req: ScenarioRequest):
 
 
 @router.post("/quick-project")
-async def quick_projection(req: AnalysisRequest):
+async def quick_projection(req: AnalysisRequest) -> dict:
     """Run just the Monte Carlo projections without AI analysis (faster)."""
     try:
-        projections = project_profile(req.profile)
+        # Cached per profile in the simulator, but a miss can wait on pool startup
+        # and JIT compilation, so keep it off the event loop
+        projections = await asyncio.to_thread(project_profile, req.profile)
         return {
             "projections": projections,
             "profile_summary": {
@@ -2,20 +2,57 @@
 
 from __future__ import annotations
 import json, re, logging
-from openai import AsyncOpenAI
-from models import FinancialProfile, DecisionItem
+from collections import OrderedDict
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Type
+from openai import AsyncOpenAI, BadRequestError
+from pydantic import BaseModel, TypeAdapter
+from models import (
+    FinancialProfile, ChatMessage, DebtType, AccountType, GoalType, RiskTolerance,
+    AnalysisResult, DecisionsResult, ScenarioComparison,
+)
 from config import get_settings
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Prefer orjson (C parser/serializer) when available; stdlib json otherwise.
+_loads = orjson.loads if orjson else json.loads
+_JSONDecodeError = orjson.JSONDecodeError if orjson else json.JSONDecodeError
+
+# Dumps validated chat messages to API dicts in one pydantic-core pass
+_MESSAGES_ADAPTER = TypeAdapter(List[ChatMessage])
+
+_FENCE_RE = re.compile(r'```(?:json)?\s*\n?(.*?)\n?```', re.DOTALL)
+
+
+def _dumps(obj, indent: bool = False) -> str:
+    """Serialize to a JSON string, using orjson when installed."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+_client: Optional[AsyncOpenAI] = None
+
 
 def _get_client() -> AsyncOpenAI:
-    """Create an OpenAI-compatible client pointing at GitHub Models API."""
-    settings = get_settings()
-    return AsyncOpenAI(
-        base_url=settings.ai_base_url,
-        api_key=settings.github_token,
-    )
+    """Return the shared OpenAI-compatible client for the GitHub Models API.
+
+    Created lazily on first use so its connection pool is reused across calls.
+    """
+    global _client
+    if _client is None:
+        settings = get_settings()
+        _client = AsyncOpenAI(
+            base_url=settings.ai_base_url,
+            api_key=settings.github_token,
+        )
+    return _client
 
 
 def _get_model_chain() -> list[str]:
@@ -24,11 +61,71 @@ def _get_model_chain() -> list[str]:
     return [settings.ai_model] + settings.ai_fallback_models
 
 
-async def _call_with_fallback(*, messages: list[dict], use_json: bool = True, temperature: float = 0.3) -> tuple[str, str]:
-    """Call the AI API with automatic fallback on failure.
-    
-    Returns (response_content, model_used) tuple.
-    Tries each model in the chain. If all fail, raises the last exception.
+def _is_schema_error(e: Exception) -> bool:
+    """Whether a structured call failed on the schema itself rather than on the model.
+
+    A 400 (e.g. `json_schema` unsupported), a refusal or output that fails validation
+    is worth retrying on the same model in JSON mode; outages, auth and rate limits are not.
+    """
+    return isinstance(e, (BadRequestError, ValueError))
+
+
+async def _call_structured(*, messages: list[dict], schema: Type[BaseModel], temperature: float = 0.3) -> tuple[dict, str]:
+    """Call the AI API with a structured-output schema, parsed by the SDK.
+
+    Returns (parsed_dict, model_used). For each model in the chain, tries structured
+    output first; if that model can't honour the schema, retries it in plain JSON
+    mode (parsed locally) before moving on. If every model fails, raises the last exception.
+    """
+    client = _get_client()
+    models = _get_model_chain()
+    last_error = None
+
+    for model in models:
+        try:
+            logger.info(f"Calling model (structured): {model}")
+            response = await client.beta.chat.completions.parse(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                response_format=schema,
+            )
+            parsed = response.choices[0].message.parsed
+            if parsed is None:
+                raise ValueError("model returned no parsed content (refusal?)")
+            result = parsed.model_dump()
+        except Exception as e:
+            last_error = e
+            logger.error(f"Model {model} structured call failed: {type(e).__name__}: {e}")
+            if not _is_schema_error(e):
+                continue
+
+            logger.warning(f"Structured output unavailable on {model} for {schema.__name__}, retrying in JSON mode")
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    response_format={"type": "json_object"},
+                )
+                result = _parse_json_strict(response.choices[0].message.content)
+            except Exception as e:
+                last_error = e
+                logger.error(f"Model {model} failed: {type(e).__name__}: {e}")
+                continue
+
+        if model != models[0]:
+            logger.warning(f"Primary model failed, succeeded with fallback: {model}")
+        return result, model
+
+    raise last_error
+
+
+async def _stream_with_fallback(*, messages: list[dict], temperature: float = 0.3) -> AsyncIterator[str]:
+    """Stream a plain-text completion, falling back across models.
+
+    Fallback only applies while opening the stream; once tokens are flowing a
+    failure is raised to the caller. If every model fails, raises the last exception.
     """
     client = _get_client()
     models = _get_model_chain()
@@ -36,27 +133,27 @@ async def _call_with_fallback(*, messages: list[dict], use_json: bool = True, te
 
     for model in models:
         try:
-            kwargs = dict(
+            logger.info(f"Streaming from model: {model}")
+            stream = await client.chat.completions.create(
                 model=model,
                 messages=messages,
                 temperature=temperature,
+                stream=True,
             )
-            if use_json:
-                kwargs["response_format"] = {"type": "json_object"}
-            
-            logger.info(f"Calling model: {model}")
-            response = await client.chat.completions.create(**kwargs)
-            content = response.choices[0].message.content
-            
-            if model != models[0]:
-                logger.warning(f"Primary model failed, succeeded with fallback: {model}")
-            
-            return content, model
         except Exception as e:
             last_error = e
             logger.error(f"Model {model} failed: {type(e).__name__}: {e}")
             continue
 
+        if model != models[0]:
+            logger.warning(f"Primary model failed, streaming from fallback: {model}")
+
+        async for chunk in stream:
+            # Some providers emit housekeeping chunks with no choices
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+        return
+
     raise last_error
 
 
@@ -64,67 +161,115 @@ def _parse_json(text: str) -> dict:
     """Parse JSON from LLM output, stripping markdown code fences if present."""
     # Try direct parse first
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
+        return _loads(text)
+    except _JSONDecodeError:
         pass
     # Strip ```json ... ``` fences
-    m = re.search(r'```(?:json)?\s*\n?(.*?)\n?```', text, re.DOTALL)
+    m = _FENCE_RE.search(text)
     if m:
-        return json.loads(m.group(1))
+        return _loads(m.group(1))
     # Last resort: find first { ... last }
     start = text.index('{')
     end = text.rindex('}') + 1
-    return json.loads(text[start:end])
+    return _loads(text[start:end])
 
 
-def _build_profile_summary(p: FinancialProfile) -> str:
-    """Create a structured plain-text summary of the financial profile for the AI."""
-    debts_text = "\n".join(
-        f"  - {d.name} ({d.type.value}): ${d.balance:,.0f} at {d.interest_rate}% APR, min ${d.minimum_payment:,.0f}/mo"
-        for d in p.debts
-    ) or "  None"
+def _parse_json_strict(text: str) -> dict:
+    """Parse output from a `response_format=json_object` call, which should be bare JSON.
+
+    Falls back to the lenient `_parse_json` if the model wrapped it anyway.
+    """
+    try:
+        return _loads(text)
+    except _JSONDecodeError:
+        return _parse_json(text)
+
+
+# Enum member -> label lookups for the summary's per-row formatting
+_DEBT_TYPE_STR = {m: m.value for m in DebtType}
+_ACCOUNT_TYPE_STR = {m: m.value for m in AccountType}
+_GOAL_TYPE_STR = {m: m.value for m in GoalType}
+_RISK_STR = {m: m.value for m in RiskTolerance}
+
+# Bound formatter: the "$1,234" spec is parsed once, not per f-string field
+_money = "${:,.0f}".format
 
-    accounts_text = "\n".join(
-        f"  - {a.name} ({a.type.value}): ${a.balance:,.0f}, contributing ${a.monthly_contribution:,.0f}/mo"
-        for a in p.accounts
-    ) or "  None"
 
-    goals_text = "\n".join(
-        f"  - {g.name} ({g.type.value}): ${g.target_amount:,.0f} by {g.target_year} [priority {g.priority}], ${g.current_savings:,.0f} saved"
-        for g in p.goals
-    ) or "  None"
+def _build_profile_summary(p: FinancialProfile) -> str:
+    """Create a structured plain-text summary of the financial profile for the AI."""
+    # Plain loops into line lists: one join per block, no generator frames
+    debt_lines = []
+    append = debt_lines.append
+    for d in p.debts:
+        append(f"  - {d.name} ({_DEBT_TYPE_STR[d.type]}): {_money(d.balance)} at {d.interest_rate}% APR, min {_money(d.minimum_payment)}/mo")
+    debts_text = "\n".join(debt_lines) or "  None"
+
+    account_lines = []
+    append = account_lines.append
+    for a in p.accounts:
+        append(f"  - {a.name} ({_ACCOUNT_TYPE_STR[a.type]}): {_money(a.balance)}, contributing {_money(a.monthly_contribution)}/mo")
+    accounts_text = "\n".join(account_lines) or "  None"
+
+    goal_lines = []
+    append = goal_lines.append
+    for g in p.goals:
+        append(f"  - {g.name} ({_GOAL_TYPE_STR[g.type]}): {_money(g.target_amount)} by {g.target_year} [priority {g.priority}], {_money(g.current_savings)} saved")
+    goals_text = "\n".join(goal_lines) or "  None"
 
     return f"""FINANCIAL PROFILE — {p.name or 'Client'}
 Age: {p.age} | Province: {p.province} | Status: {p.filing_status}
 
 INCOME
-  Gross annual: ${p.annual_income:,.0f} (${p.monthly_income:,.0f}/mo)
-  Other income: ${p.other_income:,.0f}/yr
+  Gross annual: {_money(p.annual_income)} ({_money(p.monthly_income)}/mo)
+  Other income: {_money(p.other_income)}/yr
   Expected growth: {p.income_growth_rate}%/yr
 
 EXPENSES
-  Monthly total: ${p.monthly_expenses:,.0f}
-  Housing: ${p.housing_cost:,.0f}/mo
+  Monthly total: {_money(p.monthly_expenses)}
+  Housing: {_money(p.housing_cost)}/mo
 
-DEBTS (total ${p.total_debt:,.0f})
+DEBTS (total {_money(p.total_debt)})
 {debts_text}
 
-INVESTMENTS & SAVINGS (total ${p.total_investments:,.0f})
-  Emergency fund: ${p.emergency_fund:,.0f}
+INVESTMENTS & SAVINGS (total {_money(p.total_investments)})
+  Emergency fund: {_money(p.emergency_fund)}
 {accounts_text}
 
 GOALS
 {goals_text}
 
 KEY METRICS
-  Net worth: ${p.net_worth:,.0f}
-  Monthly surplus: ${p.monthly_income - p.monthly_expenses:,.0f}
+  Net worth: {_money(p.net_worth)}
+  Monthly surplus: {_money(p.monthly_income - p.monthly_expenses)}
   Savings rate: {p.monthly_savings_rate:.1f}%
   Debt-to-income: {(p.total_debt / max(p.annual_income, 1) * 100):.1f}%
-  Risk tolerance: {p.risk_tolerance.value}
+  Risk tolerance: {_RISK_STR[p.risk_tolerance]}
 """
 
 
+# Summaries are pure functions of the profile, so memoize the last few.
+_SUMMARY_CACHE_SIZE = 128
+_summary_cache: OrderedDict[str, str] = OrderedDict()
+
+
+def profile_cache_key(p: FinancialProfile) -> str:
+    """Stable cache key for a profile (its canonical JSON serialization)."""
+    return p.model_dump_json()
+
+
+def _build_profile_summary_cached(key: str, p: FinancialProfile) -> str:
+    """Return the profile summary for `key`, building it on a cache miss."""
+    summary = _summary_cache.get(key)
+    if summary is not None:
+        _summary_cache.move_to_end(key)
+        return summary
+    summary = _build_profile_summary(p)
+    _summary_cache[key] = summary
+    if len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
+    return summary
+
+
 SYSTEM_PROMPT_ANALYSIS = """You are Compass, an expert AI financial planner built for Canadian investors. You analyze financial profiles and produce actionable, personalized plans.
 
 IMPORTANT RULES:
@@ -138,14 +283,8 @@ IMPORTANT RULES:
 OUTPUT FORMAT: Return valid JSON matching the exact schema requested. No markdown, no code fences."""
 
 
-async def analyze_profile(profile: FinancialProfile) -> dict:
-    """Generate comprehensive AI analysis of a financial profile."""
-    summary = _build_profile_summary(profile)
-
-    content, model_used = await _call_with_fallback(
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT_ANALYSIS},
-            {"role": "user", "content": f"""{summary}
+# User-prompt templates, filled with str.format per call (literal JSON braces are doubled)
+_ANALYSIS_USER_TEMPLATE = """{summary}
 
 Analyze this profile and return JSON with this exact structure:
 {{
@@ -182,28 +321,14 @@ Analyze this profile and return JSON with this exact structure:
 
 Generate 5-8 recommendations sorted by impact. Be specific to this person's situation.
 
-IMPORTANT: Return ONLY valid JSON — no markdown, no code fences, no extra text."""},
-        ],
-    )
-
-    result = _parse_json(content)
-    result["_model_used"] = model_used
-    return result
-
-
-async def generate_decisions(profile: FinancialProfile, analysis: dict) -> list[dict]:
-    """Generate decision items that require human judgment."""
-    summary = _build_profile_summary(profile)
+IMPORTANT: Return ONLY valid JSON — no markdown, no code fences, no extra text."""
 
-    content, model_used = await _call_with_fallback(
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT_ANALYSIS},
-            {"role": "user", "content": f"""{summary}
+_DECISIONS_USER_TEMPLATE = """{summary}
 
 ANALYSIS CONTEXT:
-Health Score: {analysis.get('health_score', 'N/A')}
-Key Risk: {analysis.get('key_risk', 'N/A')}
-Recommendations: {json.dumps(analysis.get('recommendations', [])[:3])}
+Health Score: {health_score}
+Key Risk: {key_risk}
+Recommendations: {recommendations}
 
 Based on this profile and analysis, generate 3-5 DECISION ITEMS that require human judgment. These are trade-offs where AI can quantify the options but the human must choose based on their values and life priorities.
 
@@ -232,18 +357,76 @@ Return JSON:
 }}
 
 IMPORTANT: Return ONLY valid JSON — no markdown, no code fences, no extra text."""
-            },
+
+_SCENARIOS_USER_TEMPLATE = """{summary}
+
+SCENARIO COMPARISON REQUEST:
+The user wants to compare these scenarios:
+{scenarios}
+
+Monte Carlo projection summaries for each:
+{projection_summaries}
+
+Return JSON:
+{{
+  "comparison_summary": "<2-3 sentence overall comparison>",
+  "recommended_scenario": "<label of recommended scenario>",
+  "reasoning": "<why this scenario is recommended — specific to this person>",
+  "trade_offs": [
+    {{
+      "scenario": "<label>",
+      "pros": ["<pro1>", "<pro2>"],
+      "cons": ["<con1>", "<con2>"],
+      "projected_outcome": "<1 sentence>"
+    }}
+  ],
+  "human_note": "<what the human should consider that the AI can't fully evaluate>"
+}}
+
+IMPORTANT: Return ONLY valid JSON — no markdown, no code fences, no extra text."""
+
+
+async def analyze_profile(profile: FinancialProfile, profile_key: Optional[str] = None) -> dict:
+    """Generate comprehensive AI analysis of a financial profile."""
+    summary = _build_profile_summary_cached(profile_key or profile_cache_key(profile), profile)
+
+    result, model_used = await _call_structured(
+        schema=AnalysisResult,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT_ANALYSIS},
+            {"role": "user", "content": _ANALYSIS_USER_TEMPLATE.format(summary=summary)},
         ],
     )
 
-    return _parse_json(content)
+    result["_model_used"] = model_used
+    return result
 
 
-async def chat_with_context(profile: FinancialProfile, messages: list[dict]) -> str:
-    """Financial planning chat with full profile context."""
-    summary = _build_profile_summary(profile)
+async def generate_decisions(profile: FinancialProfile, analysis: dict, profile_key: Optional[str] = None) -> list[dict]:
+    """Generate decision items that require human judgment."""
+    summary = _build_profile_summary_cached(profile_key or profile_cache_key(profile), profile)
 
-    system_msg = f"""{SYSTEM_PROMPT_ANALYSIS}
+    result, _ = await _call_structured(
+        schema=DecisionsResult,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT_ANALYSIS},
+            {"role": "user", "content": _DECISIONS_USER_TEMPLATE.format(
+                summary=summary,
+                health_score=analysis.get('health_score', 'N/A'),
+                key_risk=analysis.get('key_risk', 'N/A'),
+                recommendations=_dumps(analysis.get('recommendations', [])[:3]),
+            )
+            },
+        ],
+    )
+
+    return result
+
+
+@lru_cache(maxsize=_SUMMARY_CACHE_SIZE)
+def _chat_system_msg(summary: str) -> str:
+    """Build the chat system message for a profile summary (fixed per conversation)."""
+    return f"""{SYSTEM_PROMPT_ANALYSIS}
 
 You are having a conversation with a client about their finances. Here is their full profile:
 
@@ -258,57 +441,40 @@ CONVERSATION RULES:
 - If you reference a calculation, show the math briefly
 - Always suggest next steps"""
 
-    api_messages = [{"role": "system", "content": system_msg}]
-    for m in messages:
-        api_messages.append({"role": m["role"], "content": m["content"]})
 
-    content, _ = await _call_with_fallback(
-        messages=api_messages,
-        use_json=False,
-        temperature=0.6,
-    )
+async def chat_with_context(profile: FinancialProfile, messages: List[ChatMessage], profile_key: Optional[str] = None) -> AsyncIterator[str]:
+    """Financial planning chat with full profile context. Yields the reply as it streams."""
+    summary = _build_profile_summary_cached(profile_key or profile_cache_key(profile), profile)
 
-    return content
+    system_msg = _chat_system_msg(summary)
 
+    api_messages = [{"role": "system", "content": system_msg}]
+    api_messages.extend(_MESSAGES_ADAPTER.dump_python(messages))
 
-async def compare_scenarios(profile: FinancialProfile, scenarios: list[dict], projections: dict) -> dict:
-    """AI analysis comparing multiple financial scenarios."""
-    summary = _build_profile_summary(profile)
+    async for delta in _stream_with_fallback(messages=api_messages, temperature=0.6):
+        yield delta
 
-    content, _ = await _call_with_fallback(
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT_ANALYSIS},
-            {"role": "user", "content": f"""{summary}
 
-SCENARIO COMPARISON REQUEST:
-The user wants to compare these scenarios:
-{json.dumps(scenarios, indent=2)}
+async def compare_scenarios(profile: FinancialProfile, scenarios: list[dict], projections: dict, profile_key: Optional[str] = None) -> dict:
+    """AI analysis comparing multiple financial scenarios."""
+    summary = _build_profile_summary_cached(profile_key or profile_cache_key(profile), profile)
 
-Monte Carlo projection summaries for each:
-{json.dumps({k: {
-    "median_final": v.get("portfolio", {}).get("median_final", 0) if isinstance(v, dict) else 0,
-    "success_rate": v.get("portfolio", {}).get("success_rate", 0) if isinstance(v, dict) else 0,
-} for k, v in projections.items()}, indent=2)}
+    projection_summaries = _dumps({k: {
+        "median_final": v.get("portfolio", {}).get("median_final", 0) if isinstance(v, dict) else 0,
+        "success_rate": v.get("portfolio", {}).get("success_rate", 0) if isinstance(v, dict) else 0,
+    } for k, v in projections.items()}, indent=True)
 
-Return JSON:
-{{
-  "comparison_summary": "<2-3 sentence overall comparison>",
-  "recommended_scenario": "<label of recommended scenario>",
-  "reasoning": "<why this scenario is recommended — specific to this person>",
-  "trade_offs": [
-    {{
-      "scenario": "<label>",
-      "pros": ["<pro1>", "<pro2>"],
-      "cons": ["<con1>", "<con2>"],
-      "projected_outcome": "<1 sentence>"
-    }}
-  ],
-  "human_note": "<what the human should consider that the AI can't fully evaluate>"
-}}
-
-IMPORTANT: Return ONLY valid JSON — no markdown, no code fences, no extra text."""
+    result, _ = await _call_structured(
+        schema=ScenarioComparison,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT_ANALYSIS},
+            {"role": "user", "content": _SCENARIOS_USER_TEMPLATE.format(
+                summary=summary,
+                scenarios=_dumps(scenarios, indent=True),
+                projection_summaries=projection_summaries,
+            )
             },
         ],
     )
 
-    return _parse_json(content)
+    return result
@@ -1,11 +1,23 @@
 """Monte Carlo simulation engine for financial projections."""
 
 from __future__ import annotations
+import hashlib
+import multiprocessing
+import os
+import threading
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 from models import FinancialProfile, RiskTolerance
 
+try:
+    import numba as nb
+except ImportError:  # optional JIT (requirements-jit.txt); the vectorized NumPy paths are used instead
+    nb = None
+
 
 # Expected returns & volatility by risk profile (annualized)
 RETURN_PROFILES = {
@@ -27,6 +39,25 @@ class ProjectionResult:
     success_rate: float       # % of simulations reaching target
     median_final: float
     target: float = 0
+    # Reproduces the result when passed back to the call that made it. Goal results
+    # from `run_goal_projections` carry the batch seed: they reproduce only through that
+    # function with the same goal list, not via `run_projection` for a single goal.
+    seed: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        """Plain-dict view for JSON responses (a fresh dict, not `__dict__`)."""
+        return {
+            "years": self.years,
+            "median": self.median,
+            "p10": self.p10,
+            "p25": self.p25,
+            "p75": self.p75,
+            "p90": self.p90,
+            "success_rate": self.success_rate,
+            "median_final": self.median_final,
+            "target": self.target,
+            "seed": self.seed,
+        }
 
 
 @dataclass
@@ -37,6 +68,74 @@ class DebtPayoffResult:
     months_to_free: int
     total_paid: float
 
+    def to_dict(self) -> dict:
+        """Plain-dict view for JSON responses (a fresh dict, not `__dict__`)."""
+        return {
+            "strategy": self.strategy,
+            "debts": self.debts,
+            "total_interest": self.total_interest,
+            "months_to_free": self.months_to_free,
+            "total_paid": self.total_paid,
+        }
+
+
+def _simulate_yearly_numpy(
+    current_balance: float,
+    monthly_mean: float,
+    monthly_std: float,
+    contributions: np.ndarray,
+    n_simulations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Nominal year-end balances, shape (n_simulations, years + 1), vectorized over paths.
+
+    Only one year of returns is held at a time; intra-year balances are never stored.
+    """
+    years = contributions.shape[0] // 12
+    yearly = np.empty((n_simulations, years + 1), dtype=np.float32)
+    yearly[:, 0] = current_balance
+    balances = np.full(n_simulations, current_balance, dtype=np.float32)
+    growth = np.empty((n_simulations, 12), dtype=np.float32)  # reused every year
+
+    for y in range(years):
+        # One year of growth factors (1 + return) per path, drawn in one call
+        # (PCG64 + ziggurat normals, scaled and shifted in place)
+        rng.standard_normal(dtype=np.float32, out=growth)
+        growth *= monthly_std
+        growth += 1 + monthly_mean
+        for m in range(12):
+            balances *= growth[:, m]
+            balances += contributions[y * 12 + m]
+        yearly[:, y + 1] = balances
+    return yearly
+
+
+def _simulate_yearly_log(
+    current_balance: float,
+    monthly_mean: float,
+    monthly_std: float,
+    years: int,
+    n_simulations: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """`_simulate_yearly_numpy` for the no-contribution case, computed in log space.
+
+    Without deposits a path is just the starting balance times its compounded growth,
+    so each year collapses to a sum of log1p(returns) and the paths to one cumsum + exp.
+    """
+    log_growth = np.empty((n_simulations, years + 1))
+    log_growth[:, 0] = 0
+    returns = np.empty((n_simulations, 12), dtype=np.float32)
+
+    for y in range(years):
+        rng.standard_normal(dtype=np.float32, out=returns)
+        returns *= monthly_std
+        returns += monthly_mean
+        log_growth[:, y + 1] = np.log1p(returns).sum(axis=1)
+
+    np.cumsum(log_growth, axis=1, out=log_growth)
+    return (current_balance * np.exp(log_growth)).astype(np.float32)
+
 
 def run_projection(
     current_balance: float,
@@ -47,165 +146,459 @@ def run_projection(
     inflation: float = 0.02,
     n_simulations: int = 5000,
     contribution_growth: float = 0.03,  # annual growth in contributions
+    seed: Optional[int] = None,
 ) -> ProjectionResult:
-    """Run Monte Carlo simulation for investment growth."""
+    """Run Monte Carlo simulation for investment growth.
+
+    Every run is seeded (a fresh seed is drawn when none is given) and the seed is
+    returned on the result, so any projection can be reproduced exactly.
+    """
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+    ss = np.random.SeedSequence(seed)
     rp = RETURN_PROFILES[risk]
     monthly_mean = rp["mean"] / 12
     monthly_std = rp["std"] / (12 ** 0.5)
     monthly_inflation = (1 + inflation) ** (1/12) - 1
 
-    n_months = years * 12
-    all_paths = np.zeros((n_simulations, n_months + 1))
-    all_paths[:, 0] = current_balance
-
-    for m in range(1, n_months + 1):
-        returns = np.random.normal(monthly_mean, monthly_std, n_simulations)
-        # Grow contributions annually
-        year_idx = (m - 1) // 12
-        adj_contribution = monthly_contribution * ((1 + contribution_growth) ** year_idx)
-        all_paths[:, m] = all_paths[:, m - 1] * (1 + returns) + adj_contribution
-
-    # Convert to real (inflation-adjusted) dollars
-    inflation_factors = np.array([(1 + monthly_inflation) ** m for m in range(n_months + 1)])
-    real_paths = all_paths / inflation_factors
+    # Contributions grow annually: one pow per year, repeated across its 12 months
+    # (float32 keeps the simulation's memory traffic low)
+    contrib_by_year = monthly_contribution * (1 + contribution_growth) ** np.arange(years)
+    contributions = contrib_by_year.astype(np.float32).repeat(12)
+    if monthly_contribution == 0:
+        nominal = _simulate_yearly_log(
+            float(current_balance), monthly_mean, monthly_std, years, n_simulations, np.random.default_rng(ss)
+        )
+    else:
+        nominal = _simulate_yearly_numpy(
+            float(current_balance), monthly_mean, monthly_std, contributions, n_simulations, np.random.default_rng(ss)
+        )
 
-    # Sample at yearly intervals
-    yearly_indices = [i * 12 for i in range(years + 1)]
-    yearly_values = real_paths[:, yearly_indices]
+    return _summarize_projection(nominal, years, target, monthly_inflation, seed)
 
-    median = np.median(yearly_values, axis=0).tolist()
-    p10 = np.percentile(yearly_values, 10, axis=0).tolist()
-    p25 = np.percentile(yearly_values, 25, axis=0).tolist()
-    p75 = np.percentile(yearly_values, 75, axis=0).tolist()
-    p90 = np.percentile(yearly_values, 90, axis=0).tolist()
 
-    final_values = real_paths[:, -1]
-    success_rate = (float(np.mean(final_values >= target)) * 100) if target > 0 else 100.0
+def _summarize_projection(
+    nominal: np.ndarray, years: int, target: float, monthly_inflation: float, seed: Optional[int],
+) -> ProjectionResult:
+    """Percentile bands and success rate from nominal year-end balances (n_simulations, years + 1)."""
+    # Convert year-end balances to real (inflation-adjusted) dollars; only the
+    # year-end deflators are ever needed, so compute just those
+    inflation_factors = (1 + monthly_inflation) ** np.arange(0, years * 12 + 1, 12, dtype=np.float32)
+    yearly_values = (nominal / inflation_factors).astype(np.float64)
+
+    # One partition pass for all bands (rows: p10, p25, median, p75, p90)
+    bands = np.percentile(yearly_values, [10, 25, 50, 75, 90], axis=0)
+    p10, p25, median, p75, p90 = np.round(bands, 2).tolist()
+
+    # Without a target every path trivially succeeds, so only touch the final column
+    # when there is one. Count hits directly (np.percentile partitions rather than
+    # sorts, so there is no sorted copy to binary-search).
+    success_rate = 100.0
+    if target > 0:
+        success_rate = int(np.count_nonzero(yearly_values[:, -1] >= target)) / yearly_values.shape[0] * 100
 
     return ProjectionResult(
         years=list(range(years + 1)),
-        median=[round(v, 2) for v in median],
-        p10=[round(v, 2) for v in p10],
-        p25=[round(v, 2) for v in p25],
-        p75=[round(v, 2) for v in p75],
-        p90=[round(v, 2) for v in p90],
+        median=median,
+        p10=p10,
+        p25=p25,
+        p75=p75,
+        p90=p90,
         success_rate=round(success_rate, 1),
-        median_final=round(float(np.median(final_values)), 2),
+        median_final=median[-1],
         target=target,
+        seed=seed,
     )
 
 
-def simulate_debt_payoff(
-    debts: List[dict],
-    extra_monthly: float = 0,
-    strategy: str = "avalanche",
-) -> DebtPayoffResult:
-    """Simulate debt payoff with avalanche (highest rate first) or snowball (lowest balance first)."""
-    if not debts:
-        return DebtPayoffResult(strategy=strategy, debts=[], total_interest=0, months_to_free=0, total_paid=0)
+def run_goal_projections(
+    current_balances: List[float],
+    monthly_contributions: List[float],
+    years: List[int],
+    targets: List[float],
+    risk: RiskTolerance,
+    inflation: float = 0.02,
+    n_simulations: int = 5000,
+    contribution_growth: float = 0.03,
+    seed: Optional[int] = None,
+) -> List[ProjectionResult]:
+    """Monte Carlo projections for several goals that share one risk profile.
+
+    All goals are simulated together against a single matrix of market returns, so
+    each year's draw is made once rather than once per goal. Each goal's own result
+    is distributed exactly as a separate `run_projection` call would be; only the
+    goals become correlated with each other (as they would be in one real market).
+    Every result carries the one batch `seed`.
+    """
+    if not years:
+        return []
+    if seed is None:
+        seed = int(np.random.SeedSequence().generate_state(1)[0])
+
+    rp = RETURN_PROFILES[risk]
+    monthly_mean = rp["mean"] / 12
+    monthly_std = rp["std"] / (12 ** 0.5)
+    monthly_inflation = (1 + inflation) ** (1/12) - 1
+
+    max_years = max(years)
+    growth_by_year = (1 + contribution_growth) ** np.arange(max_years)
+    contrib_by_year = np.asarray(monthly_contributions, dtype=np.float64)[:, None] * growth_by_year
+    contributions = contrib_by_year.astype(np.float32).repeat(12, axis=1)
+
+    # (goals, paths) state; goals with shorter horizons simply run on and are sliced off
+    rng = np.random.default_rng(seed)
+    nominal = np.empty((len(years), n_simulations, max_years + 1), dtype=np.float32)
+    balances = np.repeat(np.asarray(current_balances, dtype=np.float32)[:, None], n_simulations, axis=1)
+    nominal[:, :, 0] = balances
+    growth = np.empty((n_simulations, 12), dtype=np.float32)
+    for y in range(max_years):
+        rng.standard_normal(dtype=np.float32, out=growth)
+        growth *= monthly_std
+        growth += 1 + monthly_mean
+        for m in range(12):
+            balances *= growth[:, m]
+            balances += contributions[:, y * 12 + m, None]
+        nominal[:, :, y + 1] = balances
+
+    return [
+        _summarize_projection(nominal[g, :, :n + 1], n, targets[g], monthly_inflation, seed)
+        for g, n in enumerate(years)
+    ]
+
+
+# Relative/absolute slack for event detection: months that land within float noise
+# of a payoff, re-rank or stop threshold are stepped exactly rather than skipped.
+_EVENT_TOL = 1e-9
+
+
+def _amortized_balances(balances, monthly_rates, payments, months):
+    """Closed-form balance after `months` of interest followed by a fixed payment.
+
+    b[k+1] = b[k] * (1 + r) - p  gives  b[n] = b[0] * (1 + r)^n - p * ((1 + r)^n - 1) / r,
+    or b[0] - n * p when r == 0. Broadcasts over debts and month counts.
+    """
+    growth_minus_one = np.expm1(months * np.log1p(monthly_rates))
+    safe_rates = np.where(monthly_rates > 0, monthly_rates, 1.0)
+    annuity = np.where(monthly_rates > 0, growth_minus_one / safe_rates, months)
+    return balances * (growth_minus_one + 1) - payments * annuity
+
+
+def _quiet_debt_months(balances, monthly_rates, payments, target, snowball, horizon) -> int:
+    """How many months (up to `horizon`) can be advanced in closed form.
+
+    A month is an event — and must be stepped exactly — if any open debt is paid
+    off in it, if the snowball target stops being the smallest balance, or if every
+    balance has fallen to the one-cent stop threshold. Returns the months before the first event.
+    """
+    open_idx = np.flatnonzero(balances > 0)
+    rates = monthly_rates[open_idx, None]
+    pays = payments[open_idx, None]
+    # Balance at the start of each upcoming month, and after that month's interest
+    start = _amortized_balances(balances[open_idx, None], rates, pays, np.arange(horizon)[None, :])
+    post_interest = start * (1 + rates)
+
+    event = (post_interest <= pays * (1 + _EVENT_TOL) + _EVENT_TOL).any(axis=0)
+    event |= (start <= 0.01 + _EVENT_TOL).all(axis=0)
+    if snowball and target is not None and len(open_idx) > 1:
+        t = np.searchsorted(open_idx, target)
+        others = np.delete(post_interest, t, axis=0)
+        event |= (others <= post_interest[t] * (1 + _EVENT_TOL) + _EVENT_TOL).any(axis=0)
+
+    hits = np.flatnonzero(event)
+    return int(hits[0]) if hits.size else horizon
 
-    # Deep copy
-    active = []
-    for d in debts:
-        active.append({
-            "name": d["name"],
-            "balance": d["balance"],
-            "rate": d["rate"],
-            "min_payment": d["min_payment"],
-            "interest_paid": 0,
-            "months": 0,
-            "original_balance": d["balance"],
-        })
+
+def _simulate_debt_numpy(balances, monthly_rates, min_payments, extra_monthly, order, snowball, max_months):
+    """Month-by-month payoff, jumping quiet stretches in closed form.
+
+    Returns (interest_paid, payoff_months, total_interest, total_paid, months). `order`
+    is the avalanche priority; snowball re-ranks by balance every month.
+    """
+    interest_paid = np.zeros(len(balances))
+    payoff_months = np.zeros(len(balances), dtype=np.int64)
 
     total_interest = 0
     total_paid = 0
     months = 0
-    max_months = 600  # 50 year cap
 
-    while any(d["balance"] > 0.01 for d in active) and months < max_months:
+    while (balances > 0.01).any() and months < max_months:
+        # Between events every open debt pays a fixed amount each month, so jump
+        # over those stretches in closed form; event months are stepped below.
+        owing = balances > 0
+        fixed_payments = np.where(owing, min_payments, 0.0)
+        target = None
+        if extra_monthly > 0:
+            if not snowball:
+                target = order[owing[order]][0]
+            else:
+                target = int(np.argmin(np.where(owing, balances * (1 + monthly_rates), np.inf)))
+            fixed_payments[target] += extra_monthly
+
+        quiet = _quiet_debt_months(
+            balances, monthly_rates, fixed_payments, target,
+            snowball=snowball, horizon=max_months - months,
+        )
+        if quiet:
+            new_balances = np.where(
+                owing, _amortized_balances(balances, monthly_rates, fixed_payments, quiet), 0.0
+            )
+            interest = new_balances - balances + quiet * fixed_payments
+            interest_paid += interest
+            total_interest += interest.sum()
+            total_paid += quiet * fixed_payments.sum()
+            balances = new_balances
+            months += quiet
+            payoff_months[owing] = months
+            if not ((balances > 0.01).any() and months < max_months):
+                break
+
         months += 1
         remaining_extra = extra_monthly
+        owing = balances > 0
 
         # Apply interest
-        for d in active:
-            if d["balance"] > 0:
-                monthly_interest = d["balance"] * (d["rate"] / 100 / 12)
-                d["balance"] += monthly_interest
-                d["interest_paid"] += monthly_interest
-                total_interest += monthly_interest
-
-        # Sort by strategy
-        if strategy == "avalanche":
-            order = sorted(range(len(active)), key=lambda i: -active[i]["rate"])
-        else:  # snowball
-            order = sorted(range(len(active)), key=lambda i: active[i]["balance"] if active[i]["balance"] > 0 else float('inf'))
+        interest = np.where(owing, balances * monthly_rates, 0.0)
+        balances += interest
+        interest_paid += interest
+        total_interest += interest.sum()
+
+        if snowball:  # smallest open balance first
+            order = np.argsort(np.where(balances > 0, balances, np.inf), kind="stable")
 
         # Pay minimums first
-        for i in range(len(active)):
-            d = active[i]
-            if d["balance"] > 0:
-                payment = min(d["min_payment"], d["balance"])
-                d["balance"] -= payment
-                total_paid += payment
+        payments = np.where(owing, np.minimum(min_payments, balances), 0.0)
+        balances -= payments
+        total_paid += payments.sum()
 
         # Apply extra to priority debt
         for i in order:
-            d = active[i]
-            if d["balance"] > 0 and remaining_extra > 0:
-                payment = min(remaining_extra, d["balance"])
-                d["balance"] -= payment
+            if remaining_extra <= 0:
+                break
+            if balances[i] > 0:
+                payment = min(remaining_extra, balances[i])
+                balances[i] -= payment
                 remaining_extra -= payment
                 total_paid += payment
 
-        for d in active:
-            if d["balance"] > 0:
-                d["months"] = months
+        payoff_months[balances > 0] = months
+
+    return interest_paid, payoff_months, total_interest, total_paid, months
+
+
+if nb is not None:
+    @nb.njit(cache=True)
+    def _simulate_debt_jit(balances, monthly_rates, min_payments, extra_monthly, order, snowball, max_months):
+        """Same contract as `_simulate_debt_numpy`, stepped one month at a time in compiled code."""
+        n = balances.shape[0]
+        balances = balances.copy()
+        interest_paid = np.zeros(n)
+        payoff_months = np.zeros(n, dtype=np.int64)
+        snowball_key = np.empty(n)
+        total_interest = 0.0
+        total_paid = 0.0
+        months = 0
+
+        while months < max_months:
+            any_left = False
+            for i in range(n):
+                if balances[i] > 0.01:
+                    any_left = True
+                    break
+            if not any_left:
+                break
+
+            months += 1
+            remaining_extra = extra_monthly
+
+            # Apply interest, then pay minimums (both only on debts open at month start)
+            owing = balances > 0
+            for i in range(n):
+                if owing[i]:
+                    interest = balances[i] * monthly_rates[i]
+                    balances[i] += interest
+                    interest_paid[i] += interest
+                    total_interest += interest
+
+            if snowball:  # smallest open balance first
+                for i in range(n):
+                    snowball_key[i] = balances[i] if balances[i] > 0 else np.inf
+                order = np.argsort(snowball_key, kind="mergesort")
+
+            for i in range(n):
+                if owing[i]:
+                    payment = min(min_payments[i], balances[i])
+                    balances[i] -= payment
+                    total_paid += payment
+
+            # Apply extra to priority debt
+            for i in order:
+                if remaining_extra <= 0:
+                    break
+                if balances[i] > 0:
+                    payment = min(remaining_extra, balances[i])
+                    balances[i] -= payment
+                    remaining_extra -= payment
+                    total_paid += payment
+
+            for i in range(n):
+                if balances[i] > 0:
+                    payoff_months[i] = months
+
+        return interest_paid, payoff_months, total_interest, total_paid, months
+
 
+def simulate_debt_payoff(
+    debts: List[dict],
+    extra_monthly: float = 0,
+    strategy: str = "avalanche",
+) -> DebtPayoffResult:
+    """Simulate debt payoff with avalanche (highest rate first) or snowball (lowest balance first)."""
+    if not debts:
+        return DebtPayoffResult(strategy=strategy, debts=[], total_interest=0, months_to_free=0, total_paid=0)
+
+    # Struct-of-arrays state: one float vector per field instead of a dict per debt
+    names = [d["name"] for d in debts]
+    original_balances = [d["balance"] for d in debts]
+    balances = np.array(original_balances, dtype=np.float64)
+    rates = np.array([d["rate"] for d in debts], dtype=np.float64)
+    monthly_rates = rates / 100 / 12
+    min_payments = np.array([d["min_payment"] for d in debts], dtype=np.float64)
+    max_months = 600  # 50 year cap
+
+    # Avalanche priority depends only on rates, so rank once. Snowball balances can
+    # cross between payoffs (e.g. a large minimum overtaking a smaller debt), so it
+    # is re-ranked monthly inside the simulation.
+    order = np.argsort(-rates, kind="stable")
+    snowball = strategy != "avalanche"
+    simulate = _simulate_debt_jit if nb is not None else _simulate_debt_numpy
+    interest_paid, payoff_months, total_interest, total_paid, months = simulate(
+        balances, monthly_rates, min_payments, float(extra_monthly), order, snowball, max_months,
+    )
+
+    interest_by_debt = (np.round(interest_paid, 2) + 0.0).tolist()  # + 0.0 folds -0.0 into 0.0
+    months_by_debt = payoff_months.tolist()
     return DebtPayoffResult(
         strategy=strategy,
         debts=[{
-            "name": d["name"],
-            "original_balance": round(d["original_balance"], 2),
-            "interest_paid": round(d["interest_paid"], 2),
-            "months_to_payoff": d["months"],
-        } for d in active],
-        total_interest=round(total_interest, 2),
+            "name": names[i],
+            "original_balance": round(original_balances[i], 2),
+            "interest_paid": interest_by_debt[i],
+            "months_to_payoff": months_by_debt[i],
+        } for i in range(len(debts))],
+        total_interest=round(float(total_interest), 2),
         months_to_free=months,
-        total_paid=round(total_paid, 2),
+        total_paid=round(float(total_paid), 2),
     )
 
 
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+_MAX_POOL_WORKERS = 2  # portfolio projection + the batched goal projections
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (respects affinity/cpusets, unlike `os.cpu_count()`)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool for independent projections (created on first use).
+
+    Uses spawn so workers never inherit the server's threads or locks. Capped at
+    _MAX_POOL_WORKERS: `project_profile` never submits more calls than that, and CPU
+    counts inside quota-limited containers can report every host core.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=min(_MAX_POOL_WORKERS, _available_cpus()),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_parallel(calls: List[tuple], seed: Optional[int] = None) -> list:
+    """Run independent `(fn, kwargs)` simulation calls, spread across processes on multi-core hosts.
+
+    Each `fn` must accept a `seed`. Calls get their own child seeds from one
+    SeedSequence (rooted at `seed` when given), so no two share a random stream and
+    seeded results do not depend on whether the pool was used. If a worker dies the
+    pool is replaced and this batch reruns in-process.
+    """
+    in_process = len(calls) < 2 or _available_cpus() < 2
+    if in_process and seed is None:
+        return [fn(**kw) for fn, kw in calls]
+
+    seeds = [int(ss.generate_state(1)[0]) for ss in np.random.SeedSequence(seed).spawn(len(calls))]
+    if not in_process:
+        pool = _get_pool()
+        try:
+            futures = [pool.submit(fn, **kw, seed=child_seed) for (fn, kw), child_seed in zip(calls, seeds)]
+            return [f.result() for f in futures]
+        except BrokenProcessPool:
+            _discard_pool(pool)
+    return [fn(**kw, seed=child_seed) for (fn, kw), child_seed in zip(calls, seeds)]
+
+
 def project_profile(profile: FinancialProfile, years: int = 30, n_sims: int = 3000) -> dict:
-    """Run full projection suite for a financial profile."""
+    """Run full projection suite for a financial profile.
+
+    Results are cached per profile. Each profile's simulations are seeded from its
+    contents, so a cached result is exactly what a fresh run would return.
+    """
+    return _project_profile_cached(profile.model_dump_json(), years, n_sims)
+
+
+@lru_cache(maxsize=256)
+def _project_profile_cached(profile_json: str, years: int, n_sims: int) -> dict:
+    seed = int.from_bytes(hashlib.blake2b(profile_json.encode(), digest_size=4).digest(), "little")
+    return _project_profile(FinancialProfile.model_validate_json(profile_json), years, n_sims, seed)
+
+
+def _project_profile(profile: FinancialProfile, years: int, n_sims: int, seed: int) -> dict:
     total_invested = profile.total_investments
     monthly_contributions = sum(a.monthly_contribution for a in profile.accounts)
     surplus = profile.monthly_income - profile.monthly_expenses
     investable_surplus = max(0, surplus - monthly_contributions) if surplus > monthly_contributions else 0
 
-    # Overall portfolio projection
-    portfolio = run_projection(
+    # Overall portfolio projection, and every goal batched into one shared simulation
+    calls = [(run_projection, dict(
         current_balance=total_invested,
         monthly_contribution=monthly_contributions + investable_surplus * 0.5,
         years=years,
         risk=profile.risk_tolerance,
         n_simulations=n_sims,
         contribution_growth=min(profile.income_growth_rate / 100, 0.05),
-    )
+    ))]
+    if profile.goals:
+        calls.append((run_goal_projections, dict(
+            current_balances=[g.current_savings for g in profile.goals],
+            monthly_contributions=[monthly_contributions / len(profile.goals)] * len(profile.goals),
+            years=[min(max(1, g.target_year - 2026), 40) for g in profile.goals],
+            targets=[g.target_amount for g in profile.goals],
+            risk=profile.risk_tolerance,
+            n_simulations=n_sims,
+        )))
+    portfolio, *rest = _run_parallel(calls, seed)
+    goal_results = rest[0] if rest else []
 
     # Goal-specific projections
     goal_projections = {}
-    for goal in profile.goals:
-        goal_years = max(1, goal.target_year - 2026)
-        proj = run_projection(
-            current_balance=goal.current_savings,
-            monthly_contribution=monthly_contributions / max(len(profile.goals), 1),
-            years=min(goal_years, 40),
-            risk=profile.risk_tolerance,
-            target=goal.target_amount,
-            n_simulations=n_sims,
-        )
+    for goal, proj in zip(profile.goals, goal_results):
         goal_projections[goal.name] = {
-            "projection": proj.__dict__,
+            "projection": proj.to_dict(),
             "target": goal.target_amount,
             "target_year": goal.target_year,
             "success_rate": proj.success_rate,
@@ -220,11 +613,11 @@ def project_profile(profile: FinancialProfile, years: int = 30, n_sims: int = 30
     snowball = simulate_debt_payoff(debt_data, extra_monthly=max(0, surplus * 0.3), strategy="snowball")
 
     return {
-        "portfolio": portfolio.__dict__,
+        "portfolio": portfolio.to_dict(),
         "goals": goal_projections,
         "debt_payoff": {
-            "avalanche": avalanche.__dict__,
-            "snowball": snowball.__dict__,
+            "avalanche": avalanche.to_dict(),
+            "snowball": snowball.to_dict(),
             "savings_vs_snowball": round(snowball.total_interest - avalanche.total_interest, 2),
         },
     }
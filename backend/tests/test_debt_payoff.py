@@ -0,0 +1,102 @@
+"""Randomized equivalence check: the debt engine against a plain monthly loop."""
+import random
+
+import pytest
+
+from services import simulator
+from services.simulator import simulate_debt_payoff
+
+
+def reference_payoff(debts, extra_monthly, strategy):
+    """Straightforward month-by-month simulation, one dict per debt."""
+    state = [{**d, "interest_paid": 0.0, "months": 0} for d in debts]
+    months = 0
+    total_interest = 0.0
+    total_paid = 0.0
+
+    while any(d["balance"] > 0.01 for d in state) and months < 600:
+        months += 1
+        for d in state:
+            if d["balance"] > 0:
+                interest = d["balance"] * d["rate"] / 100 / 12
+                d["balance"] += interest
+                d["interest_paid"] += interest
+                total_interest += interest
+
+        if strategy == "avalanche":
+            ordered = sorted(state, key=lambda d: -d["rate"])
+        else:
+            ordered = sorted(state, key=lambda d: d["balance"] if d["balance"] > 0 else float("inf"))
+
+        for d in state:
+            if d["balance"] > 0:
+                payment = min(d["min_payment"], d["balance"])
+                d["balance"] -= payment
+                total_paid += payment
+
+        remaining_extra = extra_monthly
+        for d in ordered:
+            if remaining_extra <= 0:
+                break
+            if d["balance"] > 0:
+                payment = min(remaining_extra, d["balance"])
+                d["balance"] -= payment
+                remaining_extra -= payment
+                total_paid += payment
+
+        for d in state:
+            if d["balance"] > 0:
+                d["months"] = months
+
+    return {
+        "months_to_free": months,
+        "months_to_payoff": [d["months"] for d in state],
+        "interest_paid": [d["interest_paid"] for d in state],
+        "total_interest": total_interest,
+        "total_paid": total_paid,
+    }
+
+
+def random_debts(rng):
+    # Payments stay at a dollar or more: zero-rate debts paid down in sub-cent
+    # steps can legitimately land a month apart between the two float orders.
+    return [{
+        "name": f"debt{i}",
+        "balance": rng.choice([0.0, round(rng.uniform(1, 60_000), 2)]),
+        "rate": rng.choice([0.0, 19.99, round(rng.uniform(0, 30), 2)]),
+        "min_payment": round(rng.uniform(1, 900), 2),
+    } for i in range(rng.randint(1, 8))]
+
+
+def assert_money_close(actual, expected):
+    # Results are rounded to cents; unbounded (capped) runs allow relative slack.
+    assert actual == pytest.approx(expected, abs=0.011, rel=1e-9)
+
+
+@pytest.fixture(params=["numpy", "numba"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        monkeypatch.setattr(simulator, "nb", None)
+    elif simulator.nb is None:
+        pytest.skip("numba not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_monthly_reference(engine, seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        debts = random_debts(rng)
+        extra = rng.choice([0.0, round(rng.uniform(0, 3_000), 2)])
+        strategy = rng.choice(["avalanche", "snowball"])
+
+        result = simulate_debt_payoff([dict(d) for d in debts], extra, strategy)
+        expected = reference_payoff(debts, extra, strategy)
+
+        case = (debts, extra, strategy)
+        assert result.months_to_free == expected["months_to_free"], case
+        assert [d["months_to_payoff"] for d in result.debts] == expected["months_to_payoff"], case
+        for got, want in zip(result.debts, expected["interest_paid"]):
+            assert_money_close(got["interest_paid"], want)
+        assert_money_close(result.total_interest, expected["total_interest"])
+        assert_money_close(result.total_paid, expected["total_paid"])
@@ -52,11 +52,12 @@ export default function ChatPage({ profile }: Props) {
     setLoading(true)
 
     try {
-      const response = await api.chat.send(
+      const reply = await api.chat.send(
         updatedMessages.map(m => ({ role: m.role, content: m.content })),
-        profile
+        profile,
+        partial => setMessages([...updatedMessages, { role: 'assistant', content: partial }])
       )
-      setMessages([...updatedMessages, { role: 'assistant', content: response.reply }])
+      setMessages([...updatedMessages, { role: 'assistant', content: reply }])
     } catch (err: any) {
       setMessages([
         ...updatedMessages,
@@ -111,7 +112,7 @@ export default function ChatPage({ profile }: Props) {
           </div>
         ))}
 
-        {loading && (
+        {loading && messages[messages.length - 1]?.role === 'user' && (
           <div className="chatmsg chatmsg-ai">
             <div className="chatmsg-avatar">🧭</div>
             <div className="chatmsg-bubble chatmsg-bubble-ai">
@@ -44,10 +44,32 @@ export const api = {
   },
 
   chat: {
-    send: (messages: Array<{ role: string; content: string }>, profile: FinancialProfile) =>
-      req<{ reply: string }>('/chat', {
+    /** Streams the reply; `onChunk` receives the text accumulated so far. Resolves with the full reply. */
+    send: async (
+      messages: Array<{ role: string; content: string }>,
+      profile: FinancialProfile,
+      onChunk?: (text: string) => void,
+    ): Promise<string> => {
+      const res = await fetch(`${API_BASE}/chat`, {
         method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ profile, messages }),
-      }),
+      })
+      if (!res.ok || !res.body) {
+        const err = await res.json().catch(() => ({ detail: res.statusText }))
+        throw new Error(err.detail || 'API error')
+      }
+      const reader = res.body.getReader()
+      const decoder = new TextDecoder()
+      let reply = ''
+      while (true) {
+        const { done, value } = await reader.read()
+        if (done) break
+        reply += decoder.decode(value, { stream: true })
+        onChunk?.(reply)
+      }
+      reply += decoder.decode()
+      return reply
+    },
   },
 }
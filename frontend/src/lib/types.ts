@@ -58,6 +58,7 @@ export interface ProjectionData {
   success_rate: number
   median_final: number
   target: number
+  seed: number | null
 }
 
 /* ── Analysis Result (from GPT-4) ─────────────────────── */